@@ -1,2 +1,4 @@
 # Shell script that hosts the site on a GitHub Pages server.
-python3 src/main.py "/static-site-generator/"
+# -OO strips docstrings from the compiled bytecode; the generator's
+# modules carry verbose docs, and production builds don't read them.
+python3 -OO src/main.py "/static-site-generator/"
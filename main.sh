@@ -1,3 +1,5 @@
 # Shell script that hosts the site on a local server.
-python3 src/main.py
+# -OO strips docstrings from the compiled bytecode; the generator's
+# modules carry verbose docs, and builds don't read them.
+python3 -OO src/main.py
 cd docs && python3 -m http.server 8888
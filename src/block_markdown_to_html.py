@@ -1,8 +1,28 @@
+import re
 from enum import Enum
+from functools import lru_cache
 from html_parent_leaf_node import ParentNode, text_node_to_html_node
 from textnode import TextNode, TextType
 from inline_markdown_to_html import text_to_textnodes
 
+# Precompiled block-classification patterns, built once at module load so
+# block_to_block_type can validate a block with a single C-level scan
+# instead of re-splitting and re-checking every line in Python.
+_HEADING_RE = re.compile(r"#{1,6} ")
+# Matches at the start of any line that does NOT carry the expected marker,
+# so a single search() tells us whether the whole block is valid.
+_NOT_QUOTE_LINE_RE = re.compile(r"^(?!>)", re.MULTILINE)
+_NOT_UNORDERED_LINE_RE = re.compile(r"^(?!- )", re.MULTILINE)
+# Captures the number of every line that carries an ordered-list marker.
+_ORDERED_LINE_RE = re.compile(r"^(\d+)\. ", re.MULTILINE)
+# Splits a document on blank lines, treating whitespace-only lines and runs
+# of consecutive blank lines as a single separator.
+_BLOCK_SPLIT_RE = re.compile(r"\n\s*\n")
+# Strips the leading '>' markers (and the spaces after them) from every
+# line of a quote block in a single pass. Only same-line whitespace is
+# consumed so blank quote lines keep their newline for the fold below.
+_QUOTE_MARKER_RE = re.compile(r"^>+[ \t]*", re.MULTILINE)
+
 class BlockType(Enum):
     """
     Enum representing different types of Markdown blocks 
@@ -31,15 +51,34 @@ def markdown_to_html_node(markdown_document):
     Returns:
         `ParentNode`: The HTML structure with all blocks and their inner content converted.
     """
-    # Split the Markdown document into individual blocks.
-    markdown_blocks = markdown_to_blocks(markdown_document)
-    children = []
+    # Split the Markdown document into individual blocks, then convert them.
+    return blocks_to_html_node(markdown_to_blocks(markdown_document))
 
-    # Convert each block to an HTMLNode and add it as a child.
-    for markdown_block in markdown_blocks:
-        html_node = block_to_html_node(markdown_block)
+def blocks_to_html_node(markdown_blocks):
+    """
+    Converts a list of already-split Markdown blocks into a single parent `HTMLNode`.
+
+    Callers that have split the document themselves (e.g. page generation,
+    which walks the blocks once for both the title and the body) can pass
+    the block list straight in without re-splitting the document.
+
+    Args:
+        `markdown_blocks` (list): The Markdown blocks to convert.
+
+    Returns:
+        `ParentNode`: The HTML structure with all blocks and their inner content converted.
+    """
+    # Classify every block in one tight pass first, then dispatch in a
+    # second pass. Keeping each loop to a single job lets the classifier
+    # run back-to-back over the block list instead of interleaving with
+    # the much heavier conversion work.
+    block_types = [block_to_block_type(markdown_block) for markdown_block in markdown_blocks]
+
+    children = []
+    for block_type, markdown_block in zip(block_types, markdown_blocks):
+        html_node = _BLOCK_DISPATCH[block_type](markdown_block, markdown_block.split("\n"))
         children.append(html_node)
-    
+
     # Wrap all child nodes within a parent `<div>` node.
     return ParentNode("div", children)
 
@@ -59,10 +98,11 @@ def markdown_to_blocks(markdown_document):
         list: A list of strings, each representing a block of Markdown. Inline 
               newlines within a block (e.g., for lists) are preserved.
     """
-    # Split the Markdown document into potential blocks using double newline as a delimiter.
-    blocks = markdown_document.split("\n\n")
+    # Split the Markdown document on blank-line separators in one compiled
+    # regex pass, which also collapses runs of blank lines into a single split.
+    blocks = _BLOCK_SPLIT_RE.split(markdown_document)
     processed_blocks = []
-    
+
     # Process blocks by stripping whitespace and ignoring empty blocks.
     for block in blocks:
         processed_block = block.strip()
@@ -93,43 +133,86 @@ def block_to_block_type(markdown_block):
     Returns:
         `BlockType`: The `BlockType` corresponding to the type of the Markdown block.
     """
+    # Branch on the first character so each block only runs the one
+    # classification check that can possibly apply to it.
+    first_char = markdown_block[:1]
+
     # Check for heading block. (starts with 1 to 6 '#' characters followed by a space)
-    if markdown_block.startswith(("# ", "## ", "### ", "#### ", "##### ", "###### ")):
-        return BlockType.HEADING
+    if first_char == "#":
+        if _HEADING_RE.match(markdown_block):
+            return BlockType.HEADING
 
     # Check for code block. (starts and ends with triple backticks)
-    if markdown_block.startswith("```") and markdown_block.endswith("```"):
-        return BlockType.CODE
+    elif first_char == "`":
+        if markdown_block.startswith("```") and markdown_block.endswith("```"):
+            return BlockType.CODE
 
     # Check for quote block. (every line starts with '>')
-    if markdown_block.startswith(">"):
-        block_split = markdown_block.split("\n")
-        for line in block_split:
-            if not line.startswith(">"):
-                return BlockType.PARAGRAPH
-        return BlockType.QUOTE
+    elif first_char == ">":
+        if not _NOT_QUOTE_LINE_RE.search(markdown_block):
+            return BlockType.QUOTE
 
     # Check for unordered list. (every line starts with '- ')
-    if markdown_block.startswith("- "):
-        block_split = markdown_block.split("\n")
-        for line in block_split:
-            if not line.startswith("- "):
-                return BlockType.PARAGRAPH
-        return BlockType.UNORDERED_LIST
+    elif first_char == "-":
+        if markdown_block.startswith("- ") and not _NOT_UNORDERED_LINE_RE.search(markdown_block):
+            return BlockType.UNORDERED_LIST
 
     # Check for ordered list. (every line starts with sequential numbers like '1. ', '2. ', etc.)
-    if markdown_block.startswith("1. "):
-        block_split = markdown_block.split("\n")
-        count = 1
-        for line in block_split:
-            if not line.startswith(f"{count}. "):
-                return BlockType.PARAGRAPH
-            count += 1
-        return BlockType.ORDERED_LIST
+    elif first_char == "1" and markdown_block.startswith("1. "):
+        # One compiled scan collects every line's marker number; the block is
+        # an ordered list when every line has one and they count up from 1.
+        # This avoids splitting the block and building an f-string per line.
+        # The markers are compared as strings so zero-padded numbers like
+        # "02." fall back to PARAGRAPH, matching what the converter accepts.
+        line_count = markdown_block.count("\n") + 1
+        line_numbers = _ORDERED_LINE_RE.findall(markdown_block)
+        if len(line_numbers) == line_count and all(
+            line_number == str(count)
+            for count, line_number in enumerate(line_numbers, start=1)
+        ):
+            return BlockType.ORDERED_LIST
 
     # Default to paragraph if no other type matches.
     return BlockType.PARAGRAPH
 
+def blocks_to_html(markdown_blocks):
+    """
+    Converts a list of already-split Markdown blocks straight to an HTML string.
+
+    This is the rendering path used by page generation. It writes each
+    block's cached HTML fragment into one buffer between the `<div>`
+    wrapper tags, so no intermediate wrapper node is built and the block
+    trees aren't re-traversed per document.
+
+    Args:
+        `markdown_blocks` (list): The Markdown blocks to convert.
+
+    Returns:
+        str: The HTML for all blocks, wrapped in a single `<div>`.
+    """
+    parts = ["<div>"]
+    for markdown_block in markdown_blocks:
+        parts.append(_block_to_html(markdown_block))
+    parts.append("</div>")
+    return "".join(parts)
+
+@lru_cache(maxsize=4096)
+def _block_to_html(markdown_block):
+    """
+    Renders a single Markdown block to its HTML fragment string.
+
+    Results are cached on the raw block text, so blocks repeated across
+    pages (navigation, footers, boilerplate) are converted and serialized
+    only once per build.
+
+    Args:
+        `markdown_block` (str): A single block of Markdown.
+
+    Returns:
+        str: The HTML fragment for the block.
+    """
+    return block_to_html_node(markdown_block).to_html()
+
 def block_to_html_node(markdown_block):
     """
     Converts a single Markdown block into its corresponding `HTMLNode`.
@@ -143,25 +226,15 @@ def block_to_html_node(markdown_block):
     Returns:
         `ParentNode`: The HTML representation of the block.
     """
-    # Determine the type of the block.
+    # Determine the type of the block, then convert via the dispatch table.
+    # A single hashed lookup replaces the chain of enum comparisons, and the
+    # table covers every BlockType so no fallback branch is needed.
     block_type = block_to_block_type(markdown_block)
 
-    # Convert based on block type.
-    if block_type == BlockType.PARAGRAPH:
-        return paragraph_to_html_node(markdown_block)
-    if block_type == BlockType.HEADING:
-        return heading_to_html_node(markdown_block)
-    if block_type == BlockType.CODE:
-        return code_to_html_node(markdown_block)
-    if block_type == BlockType.UNORDERED_LIST:
-        return unordered_list_to_html_node(markdown_block)
-    if block_type == BlockType.ORDERED_LIST:
-        return ordered_list_to_html_node(markdown_block)
-    if block_type == BlockType.QUOTE:
-        return quote_to_html_node(markdown_block)
-    
-    # If no type matches (though it should), raise an error.
-    raise ValueError("invalid block type")
+    # Split the block into lines once here and share the list with the
+    # converter, instead of each converter re-splitting the same text.
+    lines = markdown_block.split("\n")
+    return _BLOCK_DISPATCH[block_type](markdown_block, lines)
 
 def text_to_children(text):
     """
@@ -176,35 +249,55 @@ def text_to_children(text):
     Returns:
         `list` (`HTMLNode`): A list of child `HTMLNode` objects representing the text.
     """
+    # Copy the cached tuple into a fresh list so callers are free to build
+    # their own child lists around it.
+    return list(_text_to_children_cached(text))
+
+@lru_cache(maxsize=8192)
+def _text_to_children_cached(text):
+    """
+    Cached core of `text_to_children`, returning an immutable tuple.
+
+    Inline fragments repeat heavily across a site (navigation items,
+    headings, boilerplate), so identical text is only parsed once. The
+    generated nodes are never mutated after creation, which makes sharing
+    them between blocks and pages safe.
+
+    Args:
+        `text` (str): The plain text to parse into child nodes.
+
+    Returns:
+        tuple (`HTMLNode`): The child `HTMLNode` objects representing the text.
+    """
     text_nodes = text_to_textnodes(text)
     children_nodes = []
     for text_node in text_nodes:
         html_node = text_node_to_html_node(text_node)
         children_nodes.append(html_node)
-    return children_nodes
+    return tuple(children_nodes)
 
-def paragraph_to_html_node(markdown_block):
+def paragraph_to_html_node(markdown_block, lines):
     """
     Converts a Markdown paragraph block into an `HTMLNode` with `<p>` tags.
 
-    Splits the block into lines, joins them into a single paragraph, and
+    Folds the block's newlines into spaces to form a single paragraph and
     delegates text parsing to `text_to_children`.
 
     Args:
         `markdown_block` (str): The paragraph block of Markdown.
+        `lines` (list): The block's lines. (unused, passed for uniform dispatch)
 
     Returns:
         `ParentNode`: An `HTMLNode` wrapped in `<p>` tags and containing child nodes.
     """
-    # Capture the paragraph text.
-    paragraph_lines = markdown_block.split("\n")
-    paragraph = " ".join(paragraph_lines)
+    # Fold the newlines in one C-level pass over the block.
+    paragraph = markdown_block.replace("\n", " ")
 
     # Process the paragraph block node tree.
     children_nodes = text_to_children(paragraph)
     return ParentNode("p", children_nodes)
 
-def heading_to_html_node(markdown_block):
+def heading_to_html_node(markdown_block, lines):
     """
     Converts a Markdown heading block into an `HTMLNode` with `<h1>-<h6>` tags.
 
@@ -213,6 +306,7 @@ def heading_to_html_node(markdown_block):
 
     Args:
         `markdown_block` (str): The heading block of Markdown.
+        `lines` (list): The block's lines. (unused, passed for uniform dispatch)
 
     Returns:
         `ParentNode`: An `HTMLNode` with the appropriate `<h1>-<h6>` tag.
@@ -232,7 +326,7 @@ def heading_to_html_node(markdown_block):
     children_nodes = text_to_children(symbols_and_heading[1])
     return ParentNode(f"h{count}", children_nodes)
 
-def code_to_html_node(markdown_block):
+def code_to_html_node(markdown_block, lines):
     """
     Converts a Markdown code block into a `<pre>` and `<code>` wrapped `HTMLNode`.
 
@@ -241,6 +335,7 @@ def code_to_html_node(markdown_block):
 
     Args:
         `markdown_block` (str): The code block in Markdown.
+        `lines` (list): The block's lines. (unused, passed for uniform dispatch)
 
     Returns:
         `ParentNode`: An `HTMLNode` with `<pre>` and `<code>` tags.
@@ -261,7 +356,7 @@ def code_to_html_node(markdown_block):
     code_node = ParentNode("code", [child_node])
     return ParentNode("pre", [code_node])
 
-def unordered_list_to_html_node(markdown_block):
+def unordered_list_to_html_node(markdown_block, lines):
     """
     Converts a Markdown unordered list into a `<ul>` wrapped `HTMLNode`.
 
@@ -269,6 +364,7 @@ def unordered_list_to_html_node(markdown_block):
 
     Args:
         `markdown_block` (str): The unordered list block from Markdown.
+        `lines` (list): The block's lines, pre-split by `block_to_html_node`.
 
     Returns:
         `ParentNode`: An `HTMLNode` wrapped in `<ul>` tags with `<li>` child nodes.
@@ -276,10 +372,9 @@ def unordered_list_to_html_node(markdown_block):
     Raises:
         `ValueError`: If a line within the block isn't formatted as a valid list item.
     """
-    list_lines = markdown_block.split("\n")
     child_nodes = []
 
-    for list_line in list_lines:
+    for list_line in lines:
         # Validate unordered list line formatting.
         if not list_line.startswith("-"):
             raise ValueError("invalid unordered list line")
@@ -294,7 +389,7 @@ def unordered_list_to_html_node(markdown_block):
     # Process the unordered list block node tree.
     return ParentNode("ul", child_nodes)
 
-def ordered_list_to_html_node(markdown_block):
+def ordered_list_to_html_node(markdown_block, lines):
     """
     Converts a Markdown ordered list into an `<ol>` wrapped `HTMLNode`.
 
@@ -303,6 +398,7 @@ def ordered_list_to_html_node(markdown_block):
 
     Args:
         `markdown_block` (str): The ordered list block from Markdown.
+        `lines` (list): The block's lines, pre-split by `block_to_html_node`.
 
     Returns:
         `ParentNode`: An `HTMLNode` wrapped in `<ol>` tags with `<li>` child nodes.
@@ -310,11 +406,10 @@ def ordered_list_to_html_node(markdown_block):
     Raises:
         `ValueError`: If a line within the block isn't formatted with the proper numbering.
     """
-    list_lines = markdown_block.split("\n")
     child_nodes = []
     count = 1
 
-    for list_line in list_lines:
+    for list_line in lines:
         # Validate ordered list line formatting.
         if not list_line.startswith(f"{count}."):
             raise ValueError(f"invalid ordered list line: {count}.")
@@ -330,35 +425,36 @@ def ordered_list_to_html_node(markdown_block):
     # Process the ordered list block node tree.
     return ParentNode("ol", child_nodes)
 
-def quote_to_html_node(markdown_block):
+def quote_to_html_node(markdown_block, lines):
     """
     Converts a Markdown blockquote into a `<blockquote>` wrapped `HTMLNode`.
 
-    Processes each line of the blockquote, removes the `>` markers, and
-    joins the lines into a single string. Inline Markdown is parsed
-    while keeping the blockquote structure intact.
+    Removes the `>` markers from every line in one compiled-regex pass and
+    folds the lines into a single string. Inline Markdown is parsed while
+    keeping the blockquote structure intact. The block's line formatting
+    was already validated by `block_to_block_type` during classification.
 
     Args:
         `markdown_block` (str): The blockquote text block from Markdown.
+        `lines` (list): The block's lines. (unused, passed for uniform dispatch)
 
     Returns:
         `ParentNode`: An `HTMLNode` wrapped in `<blockquote>` tags with parsed children.
-
-    Raises:
-        `ValueError`: If a line within the block doesn't start with a `>` marker.
     """
-    quote_lines = markdown_block.split("\n")
-    processed_lines = []
-
-    for quote_line in quote_lines:
-        # Validate the quote block formatting.
-        if not quote_line.startswith(">"):
-            raise ValueError("invalid quote block")
-        
-        # Capture the text of the quote lines, strips whitespace, and joins them together.
-        processed_lines.append(quote_line.lstrip(">").strip())
-    quote_text = " ".join(processed_lines)
+    # Strip the quote markers in one scan, then fold the newlines.
+    quote_text = _QUOTE_MARKER_RE.sub("", markdown_block).replace("\n", " ")
 
     # Process the quote block node tree.
     child_nodes = text_to_children(quote_text)
     return ParentNode("blockquote", child_nodes)
+
+# Maps each BlockType to its converter function, built once at import time
+# and used by block_to_html_node for O(1) dispatch.
+_BLOCK_DISPATCH = {
+    BlockType.PARAGRAPH: paragraph_to_html_node,
+    BlockType.HEADING: heading_to_html_node,
+    BlockType.CODE: code_to_html_node,
+    BlockType.QUOTE: quote_to_html_node,
+    BlockType.UNORDERED_LIST: unordered_list_to_html_node,
+    BlockType.ORDERED_LIST: ordered_list_to_html_node,
+}
@@ -1,102 +1,178 @@
+import logging
+import mmap
 import os
-from block_markdown_to_html import markdown_to_html_node
+import re
+from concurrent.futures import ProcessPoolExecutor
+from block_markdown_to_html import blocks_to_html, markdown_to_blocks
+
+# Matches every template substitution point in one pattern, so the whole
+# template is rewritten in a single scan instead of one .replace pass
+# (and one full-document copy) per placeholder.
+_TEMPLATE_RE = re.compile(r'\{\{ Title \}\}|\{\{ Content \}\}|href="/|src="/')
+
+# Finds the first h1 header in a document. Searching with this pattern
+# stops at the first match instead of splitting every line of the file.
+_H1_TITLE_RE = re.compile(r"^# (.+)", re.MULTILINE)
+
+# Rewrites root-relative URLs in rendered content to the configured base
+# path in one scan, where chained .replace calls would each copy the
+# whole document.
+_BASEPATH_RE = re.compile(r'\b(href|src)="/')
+
+# Status messages go through logging so per-page output can be batched,
+# filtered, or silenced without touching the generation code.
+log = logging.getLogger(__name__)
 
 def generate_pages_recursive(content_dir_path, template_path, dest_dir_path, basepath):
     """
     Recursively generates HTML pages from markdown files.
-    
+
+    Each markdown file is an independent unit of work, so the content tree
+    is walked up front to collect every page, the template is read once,
+    and the pages are then generated in parallel across a process pool.
+
     Args:
         `content_dir_path` (str): Path to the directory containing markdown content.
         `template_path` (str): Path to the HTML template file.
         `dest_dir_path` (str): Path to the destination directory for generated HTML files.
         `basepath` (str): Base URL path for the site. (e.g., '/' for local, '/repo-name/' for GitHub Pages)
-        
+
     Raises:
         `ValueError`: If the content directory path is invalid.
-    
+
     Side effects:
-        - Uses `generate_page` to generate directories and files for `dest_html_path`.
+        - Uses `_generate_page_worker` to generate directories and files for each page.
     """
-    # Validate content directory exists. 
+    # Validate content directory exists.
     if not os.path.exists(content_dir_path):
         raise ValueError("Invalid content path.")
-    
-    # Get all entries in the content directory.
-    path_entries = os.listdir(content_dir_path)
-    
-    for entry in path_entries:
-        # Create full paths for source and destination.
-        content_path = os.path.join(content_dir_path, entry)
-        dest_path = os.path.join(dest_dir_path, entry)
-        if os.path.isfile(content_path):
-            # If it's a markdown file, convert to HTML.
-            if content_path.endswith(".md"):
+
+    # Read the template once here instead of once per page inside the workers.
+    with open(template_path) as file:
+        template_doc = file.read()
+
+    # Walk the content tree and collect one task per markdown file.
+    tasks = []
+    for dir_path, _dir_names, file_names in os.walk(content_dir_path):
+        relative_dir = os.path.relpath(dir_path, content_dir_path)
+        for file_name in file_names:
+            if file_name.endswith(".md"):
+                content_path = os.path.join(dir_path, file_name)
                 # Change extension from .md to .html.
-                dest_html_path = dest_path[:-3] + ".html"
-                # Generate the HTML page from markdown file using the template.
-                # Apply the correct base path for link.
-                generate_page(content_path, template_path, dest_html_path, basepath)
-        elif os.path.isdir(content_path):
-            # If it's a directory, create the corresponding directory in the destination
-            # and recursively process its contents.
-            generate_pages_recursive(content_path, template_path, dest_path, basepath)
+                dest_html_path = os.path.normpath(
+                    os.path.join(dest_dir_path, relative_dir, file_name[:-3] + ".html")
+                )
+                tasks.append((content_path, template_doc, dest_html_path, basepath))
 
-def generate_page(from_path, template_path, dest_path, basepath):
+    # Fan the page generation out across all cores.
+    # list() drains the lazy map so worker exceptions surface here.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_generate_page_worker, tasks, chunksize=8))
+
+def _generate_page_worker(task):
     """
-    Generate an HTML page from a markdown file using a template.
+    Process-pool entry point that generates a single HTML page.
+
+    Args:
+        `task` (tuple): A `(from_path, template_doc, dest_path, basepath)` tuple,
+                        where `template_doc` is the already-read template string.
+
+    Side effects:
+        - Generates the page via `generate_page_from_template_str`.
+    """
+    from_path, template_doc, dest_path, basepath = task
+    generate_page_from_template_str(from_path, template_doc, dest_path, basepath)
+
+def generate_page_from_template_str(from_path, template_doc, dest_path, basepath):
+    """
+    Generate an HTML page from a markdown file using an already-read template.
+
+    This is the shared rendering core: `generate_pages_recursive` reads the
+    template once per build and its workers pass the string here, so the
+    template file is never re-opened per page.
 
-    This function:
-    1. Reads markdown content and HTML template
-    2. Extracts the title from the markdown
-    3. Converts markdown content to HTML
-    4. Replaces template placeholders with actual content
-    5. Adjusts URL paths according to the base path
-    6. Writes the final HTML to the destination file
-    
     Args:
         `from_path` (str): Path to the markdown file to convert.
-        `template_path` (str): Path to the HTML template file.
+        `template_doc` (str): The template's HTML, already read from disk.
         `dest_path` (str): Path where the generated HTML file will be saved.
-        `basepath` (str): Base URL path for the site (e.g., '/' for local, '/repo-name/' for GitHub Pages)
-    
+        `basepath` (str): Base URL path for the site. (e.g., '/' for local, '/repo-name/' for GitHub Pages)
+
     Side effects:
-        - Creates directories in `dest_path` if they don't exist.
-        - Writes generated HTML to `dest_path`.
-        - Prints status message to console.
+        - Creates directories in the destination path if they don't exist.
+        - Writes generated HTML to the destination file.
+        - Logs a status message for the page.
     """
     # Log the generation process.
-    print(f"Generating page from {from_path} to {dest_path} using {template_path}")
+    log.info("Generating page from %s to %s", from_path, dest_path)
 
-    # Read and store the markdown content.
-    with open(from_path) as file:
-        from_doc = file.read()
+    # Map the markdown file into memory and decode it in one step; the OS
+    # pages the bytes in directly instead of copying them through a
+    # userspace read buffer first.
+    with open(from_path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_doc:
+            from_doc = mapped_doc[:].decode("utf-8")
 
-    # Read and store the HTML template.
-    with open(template_path) as file:
-        template_doc = file.read()
-    
-    # Extract the title from the markdown content.
+    # Extract the title from the markdown content. This search stops at
+    # the first h1 header rather than walking the whole document.
     title = extract_title(from_doc)
-    
-    # Convert markdown to HTML.
-    content = markdown_to_html_node(from_doc).to_html()
-    
-    # Replace placeholders in the template with content and title.
-    new_template = template_doc.replace("{{ Title }}", title).replace("{{ Content }}", content)
-    
-    # Fix relative URLs to work with the configured base path.
-    # This is crucial for GitHub Pages where the site is in a subdirectory.
-    new_template = new_template.replace('href="/', f'href="{basepath}').replace('src="/', f'src="{basepath}')
+
+    # Split the document into blocks once and render them straight to HTML,
+    # bypassing the wrapper-node tree walk.
+    markdown_blocks = markdown_to_blocks(from_doc)
+    content = blocks_to_html(markdown_blocks)
+
+    # Fix relative URLs in the generated content to work with the configured
+    # base path. This is crucial for GitHub Pages where the site is in a
+    # subdirectory. One compiled-regex pass rewrites both attribute kinds,
+    # and the content is rewritten before it is inserted so the template
+    # itself also only needs a single substitution pass.
+    content = _BASEPATH_RE.sub(lambda match: f'{match.group(1)}="{basepath}', content)
+
+    # Replace the title/content placeholders and the template's own relative
+    # URLs in one scan over the template.
+    replacements = {
+        "{{ Title }}": title,
+        "{{ Content }}": content,
+        'href="/': f'href="{basepath}',
+        'src="/': f'src="{basepath}',
+    }
+    new_template = _TEMPLATE_RE.sub(lambda match: replacements[match.group(0)], template_doc)
 
     # Ensure the destination directory exists, then make directories as needed.
     dest_dir_name = os.path.dirname(dest_path)
     if dest_dir_name != "":
         os.makedirs(dest_dir_name, exist_ok=True)
-    
+
     # Write the final HTML to the destination file.
     with open(dest_path, "w") as file:
         file.write(new_template)
 
+def generate_page(from_path, template_path, dest_path, basepath):
+    """
+    Generate an HTML page from a markdown file using a template.
+
+    Convenience wrapper for one-off pages: reads the template from disk
+    and delegates to `generate_page_from_template_str`, which does the
+    actual rendering. Batch builds read the template once up front and
+    call the core directly.
+    
+    Args:
+        `from_path` (str): Path to the markdown file to convert.
+        `template_path` (str): Path to the HTML template file.
+        `dest_path` (str): Path where the generated HTML file will be saved.
+        `basepath` (str): Base URL path for the site (e.g., '/' for local, '/repo-name/' for GitHub Pages)
+    
+    Side effects:
+        - Creates directories in `dest_path` if they don't exist.
+        - Writes generated HTML to `dest_path`.
+        - Logs a status message for the page.
+    """
+    # Read the template, then hand off to the shared rendering core.
+    with open(template_path) as file:
+        template_doc = file.read()
+
+    generate_page_from_template_str(from_path, template_doc, dest_path, basepath)
+
 def extract_title(markdown):
     """
     Extract the h1 header from a `markdown` string and return it as the title.
@@ -110,15 +186,14 @@ def extract_title(markdown):
     Raises:
         `ValueError`: If no h1 header is found in the `markdown`.
     """
-    # Split the markdown into separate lines.
-    lines = markdown.split("\n")
-
-    # Check each line for an h1 header. (starts with '# ')
-    for line in lines:
-        if line.startswith("# "):
-            # Remove the '# ' prefix and any leading/trailing whitespace.
-            title = line[2:].strip()
-            return title
-    
+    # Search for the first h1 header. (a line starting with '# ')
+    # The scan short-circuits at the first match instead of tokenizing
+    # the whole document into lines.
+    match = _H1_TITLE_RE.search(markdown)
+
     # If no h1 header is found, raise an error.
-    raise ValueError("No title found in markdown.")
+    if match is None:
+        raise ValueError("No title found in markdown.")
+
+    # Remove any leading/trailing whitespace around the title text.
+    return match.group(1).strip()
@@ -1,10 +1,39 @@
+import io
+import sys
 from textnode import TextType
 
+# Open/close tag pairs keyed by tag name, filled on first use. Tags come
+# from a small fixed set, so the hot no-props render path reuses these
+# strings instead of re-interpolating the tag twice per node.
+_TAG_PARTS = {}
+
+def _tag_parts(tag):
+    """
+    Returns the cached `(open_tag, close_tag)` pair for a `tag` name.
+
+    Args:
+        `tag` (str): The HTML tag name. (e.g., `"b"`, `"p"`, `"h1"`)
+
+    Returns:
+        tuple: The `("<tag>", "</tag>")` strings for the tag.
+    """
+    parts = _TAG_PARTS.get(tag)
+    if parts is None:
+        parts = (f"<{tag}>", f"</{tag}>")
+        _TAG_PARTS[tag] = parts
+    return parts
+
 class HTMLNode:
     """
     Represents an HTML element in a document tree structure.
     Can represent block-level or inline elements with optional attributes.
     """
+    # Slots drop the per-instance __dict__; a build allocates thousands of
+    # nodes, so this cuts their memory footprint and speeds attribute
+    # access in the hot serialization path. _html is the subclasses'
+    # render cache.
+    __slots__ = ("tag", "value", "children", "props", "_html", "_props_html")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         """
         Initialize an HTML node with optional parameters.
@@ -22,6 +51,9 @@ class HTMLNode:
         self.value = value
         self.children = children
         self.props = props
+        # One-slot cache for the rendered attribute string; props are
+        # never mutated after construction.
+        self._props_html = None
 
     def to_html(self):
         """
@@ -37,18 +69,24 @@ class HTMLNode:
         """
         Converts the node's properties (HTML attributes) to a string.
         
+        The rendered string is cached on the node, so serializing a node
+        repeatedly only formats its attributes once.
+
         Returns:
             String with HTML attributes formatted as `key="value"` with leading spaces.
             Empty string if no properties exist.
         """
-        if self.props is None:
-            return ""
-
-        # Generate props HTML string for HTMLNode.
-        props_html = ""
-        for prop_key in self.props:
-            props_html += f' {prop_key}="{self.props[prop_key]}"'
-        return props_html
+        if self._props_html is None:
+            if self.props is None:
+                self._props_html = ""
+            else:
+                # Generate props HTML string for HTMLNode. Joining a
+                # comprehension builds the string in one allocation instead
+                # of copying it on every += iteration.
+                self._props_html = "".join(
+                    f' {prop_key}="{prop_value}"' for prop_key, prop_value in self.props.items()
+                )
+        return self._props_html
 
     def __repr__(self):
         """
@@ -65,6 +103,9 @@ class ParentNode(HTMLNode):
     They render as HTML elements with opening and closing `tag`s
     containing their `children`'s HTML.
     """
+    # No new attributes beyond the base class's slots.
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         """
         Initialize a new `ParentNode` instance.
@@ -79,34 +120,36 @@ class ParentNode(HTMLNode):
                                       Defaults to `None`.
         """
         super().__init__(tag, None, children, props)
+        # One-slot cache for the serialized subtree; nodes are never
+        # mutated after construction, so the first render stays valid.
+        self._html = None
 
     def to_html(self):
         """
         Convert the `ParentNode` and all its `children` to an HTML string.
-        
+
+        The serialized subtree is cached on the node, so re-rendering a
+        shared fragment (navigation, repeated inline spans) returns the
+        stored string instead of re-walking its children.
+
         Raises:
             `ValueError`: If tag is `None` or `children` is `None`.
-            
+
         Returns:
             str: HTML representation of this node and its `children`.
         """
-        # Raise error if tag is None or children is None.
-        if self.tag is None:
-            raise ValueError("invalid HTML: no tag")
-        if self.children is None:
-            raise ValueError("invalid HTML: no children")
-        
-        # Create opening tag with properties.
-        parent_html = f"<{self.tag}{self.props_to_html()}>"
+        if self._html is not None:
+            return self._html
+
+        # Stream every fragment into one growing buffer instead of
+        # rebuilding the string with += at each tree level. StringIO
+        # appends in place, so the individual fragments are not all kept
+        # alive until a final join.
+        out = io.StringIO()
+        render_to_buffer(self, out)
+        self._html = out.getvalue()
+        return self._html
 
-        # Add HTML from all children.
-        for child in self.children:
-            parent_html += child.to_html()
-        
-        # Add closing tag.
-        parent_html += f"</{self.tag}>"
-        return parent_html
-    
     def __repr__(self):
         """
         Prints a string representation of the `ParentNode`'s properties 
@@ -124,6 +167,9 @@ class LeafNode(HTMLNode):
     
     Examples include text in paragraphs, anchors, and formatted text. (e.g., bold, italic)
     """
+    # No new attributes beyond the base class's slots.
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
         """
         Initialize a `LeafNode` object which represents an HTML element without `children`.
@@ -138,27 +184,50 @@ class LeafNode(HTMLNode):
                                       Defaults to `None`.
         """
         super().__init__(tag, value, None, props)
+        # One-slot cache for the rendered HTML; nodes are never mutated
+        # after construction, so the first render stays valid.
+        self._html = None
+        # Leaves are built to be rendered, so their attribute string is
+        # computed eagerly here; to_html then reads a plain field instead
+        # of looping the props dict at render time.
+        if props:
+            self._props_html = "".join(
+                f' {prop_key}="{prop_value}"' for prop_key, prop_value in props.items()
+            )
+        else:
+            self._props_html = ""
 
     def to_html(self):
         """
         Converts the `LeafNode` to an HTML string representation of this node.
-        
+
+        The rendered string is cached on the node, so leaves that appear
+        in repeated fragments are only formatted once.
+
         Returns:
             str: HTML representation of this node
             
         Raises:
             `ValueError`: If the node has no `value`
         """
+        if self._html is not None:
+            return self._html
 
         # Raise error if the node has no value.
         if self.value is None:
             raise ValueError("invalid HTML: no value")
         
         if self.tag is None:
-            return self.value
-        
-        # Generate HTML string for LeafNode.
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+            self._html = self.value
+        elif not self.props:
+            # Generate HTML string from the shared open/close pair for
+            # this tag, skipping the props machinery entirely.
+            open_tag, close_tag = _tag_parts(self.tag)
+            self._html = open_tag + self.value + close_tag
+        else:
+            # Generate HTML string for LeafNode.
+            self._html = f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+        return self._html
 
     def __repr__(self):
         """
@@ -167,6 +236,66 @@ class LeafNode(HTMLNode):
         """
         return f"LeafNode(tag: {self.tag}, value: {self.value}, props: {self.props})"
 
+def render_to_buffer(node, out):
+    """
+    Writes the HTML fragments for `node` and all its descendants to `out`.
+
+    Streaming fragments into a single shared buffer keeps rendering
+    linear in the size of the output, where repeated string concatenation
+    across the tree would be quadratic. The tree is walked with an
+    explicit work stack rather than Python recursion, so deeply nested
+    documents pay no per-node call-frame overhead and cannot hit the
+    interpreter's recursion limit.
+
+    Args:
+        `node` (`HTMLNode`): The node to render.
+        `out` (`io.StringIO`): The buffer the HTML fragments are written to.
+
+    Raises:
+        `ValueError`: If a `ParentNode` in the tree has no `tag` or no `children`.
+    """
+    # Work items are either nodes still to render or ready-made string
+    # fragments. (a parent's closing tag, pushed below its children)
+    stack = [node]
+    out_append = out.write
+
+    while stack:
+        item = stack.pop()
+
+        if type(item) is str:
+            # A closing tag queued when its parent was opened.
+            out_append(item)
+        elif isinstance(item, ParentNode):
+            # A parent that was already serialized contributes its cached
+            # subtree string without being walked again.
+            if item._html is not None:
+                out_append(item._html)
+                continue
+
+            # Raise error if tag is None or children is None.
+            if item.tag is None:
+                raise ValueError("invalid HTML: no tag")
+            if item.children is None:
+                raise ValueError("invalid HTML: no children")
+
+            # Emit the opening tag now; queue the closing tag beneath the
+            # children so it is emitted after them. (the stack is LIFO, so
+            # children are pushed reversed to come back out in order)
+            # Parents without attributes — the overwhelming majority —
+            # reuse the shared open/close pair for their tag instead of
+            # calling into the props machinery.
+            if item.props is None:
+                open_tag, close_tag = _tag_parts(item.tag)
+                out_append(open_tag)
+                stack.append(close_tag)
+            else:
+                out_append(f"<{item.tag}{item.props_to_html()}>")
+                stack.append(f"</{item.tag}>")
+            stack.extend(reversed(item.children))
+        else:
+            # Leaf nodes render to a single fragment.
+            out_append(item.to_html())
+
 def text_node_to_html_node(text_node):
     """
     Converts a `TextNode` object into a corresponding `HTMLNode`,
@@ -183,36 +312,37 @@ def text_node_to_html_node(text_node):
     Raises:
         `ValueError`: If the `text_node`'s `text_type` is not a known `TextType`.
     """
-    # Maps each TextType to its corresponding HTML tag and any special properties.
-    text_type_map = {
-        TextType.TEXT: {"tag": None},
-        TextType.BOLD: {"tag": "b"},
-        TextType.ITALIC: {"tag": "i"},
-        TextType.CODE: {"tag": "code"},
-        TextType.LINK: {"tag": "a"},
-        TextType.IMAGE: {"tag": "img"}
-    }
-
-    # Check if TextType is valid and exists in mapping, 
-    # then generates LeafNode arguments as needed for each TextType.
-    if text_node.text_type in text_type_map:
-        tag_dict = text_type_map[text_node.text_type]
-        tag = tag_dict["tag"]
-        value = text_node.text
-        props = {}
-
-        if text_node.text_type == TextType.LINK:
-            props["href"] = text_node.url
-
-        elif text_node.text_type == TextType.IMAGE:
-            props["src"] = text_node.url
-            props["alt"] = text_node.text
-            value = ""
-
-        # Create and return the corresponding LeafNode.    
-        return LeafNode(tag, value, props)
-
-    else:
+    # One hashed lookup into the module-level builder table replaces the
+    # per-call map construction and the chain of type comparisons.
+    try:
+        return _LEAF_BUILDERS[text_node.text_type](text_node)
+    except KeyError:
         # Raise an error if the provided TextType is not valid.
         raise ValueError(f"Unknown TextType: {text_node.text_type}")
 
+# Interned tag constants: every generated leaf shares one string object
+# per tag, so comparisons are pointer-equal and no per-node copies exist.
+_TAG_B = sys.intern("b")
+_TAG_I = sys.intern("i")
+_TAG_CODE = sys.intern("code")
+_TAG_A = sys.intern("a")
+_TAG_IMG = sys.intern("img")
+
+# Interned attribute names used as props keys, so every link and image
+# node shares one key object per name and dict lookups and equality
+# checks on props short-circuit on pointer identity.
+_ATTR_HREF = sys.intern("href")
+_ATTR_SRC = sys.intern("src")
+_ATTR_ALT = sys.intern("alt")
+
+# Maps each TextType to a builder producing its LeafNode, built once at
+# import time. Link and image nodes are the only ones carrying props.
+_LEAF_BUILDERS = {
+    TextType.TEXT: lambda text_node: LeafNode(None, text_node.text, {}),
+    TextType.BOLD: lambda text_node: LeafNode(_TAG_B, text_node.text, {}),
+    TextType.ITALIC: lambda text_node: LeafNode(_TAG_I, text_node.text, {}),
+    TextType.CODE: lambda text_node: LeafNode(_TAG_CODE, text_node.text, {}),
+    TextType.LINK: lambda text_node: LeafNode(_TAG_A, text_node.text, {_ATTR_HREF: text_node.url}),
+    TextType.IMAGE: lambda text_node: LeafNode(_TAG_IMG, "", {_ATTR_SRC: text_node.url, _ATTR_ALT: text_node.text}),
+}
+
@@ -1,6 +1,47 @@
 import re
+from functools import lru_cache
 from textnode import TextNode, TextType
 
+# Precompiled inline patterns, built once at module load so the extractors
+# skip re's per-call cache lookup on every inline span.
+# [^\[\]]* matches any character except brackets for the alt/anchor text,
+# [^\(\)]* matches any character except parentheses for the URL, and the
+# link pattern's (?<!!) negative lookbehind keeps it from matching images.
+_IMG_RE = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+_LINK_RE = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+# Combined image-or-link pattern for the extractors. The optional (!?)
+# marker group distinguishes the two kinds in one scan: a match that
+# consumed a leading ! is an image, any other is a link. Consuming the !
+# makes the lookbehind unnecessary — the bracket of an image can never
+# also start a link match.
+_LINK_OR_IMG_RE = re.compile(r"(!?)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+# One combined pattern for every inline span. text_to_textnodes walks the
+# string once with this instead of re-scanning it per delimiter kind, and
+# the alternation order (bold, italic, code, image, link) mirrors the
+# order of the old sequential passes. The bold content is matched lazily
+# so consecutive ** markers pair up exactly as split("**") did, which
+# lets the span contain lone * characters. All three delimiter spans may
+# match empty (****, __, ``); empty spans are dropped during dispatch,
+# as the old split pipeline skipped empty parts.
+_INLINE_TOKEN_RE = re.compile(
+    r"(?P<bold>\*\*[\s\S]*?\*\*)"
+    r"|(?P<italic>_[^_]*_)"
+    r"|(?P<code>`[^`]*`)"
+    r"|(?P<image>!\[(?P<img_alt>[^\[\]]*)\]\((?P<img_url>[^\(\)]*)\))"
+    r"|(?P<link>(?<!!)\[(?P<link_text>[^\[\]]*)\]\((?P<link_url>[^\(\)]*)\))"
+)
+
+# A delimiter left in plain text after tokenizing means its span never
+# closed, which the old sequential passes rejected as unbalanced.
+_STRAY_DELIMITER_RE = re.compile(r"\*\*|_|`")
+
+# Any character that can open an inline span. Most strings on a page
+# contain none of them, so one cheap scan lets text_to_textnodes skip
+# the tokenizer entirely for plain text.
+_SPECIAL_CHAR_RE = re.compile(r"[*_`\[]")
+
 def text_to_textnodes(text):
     """
     Converts a raw markdown-flavored string into a list of `TextNode` objects.
@@ -22,32 +63,96 @@ def text_to_textnodes(text):
     Example:
         Input: `"This is **bold** and a [link](https://example.com)"`  
         Output: `[`\n
-            `TextNode("This is ", TextType.TEXT),`  
-            `TextNode("bold", TextType.BOLD),`  
-            `TextNode(" and a ", TextType.TEXT),`  
+            `TextNode("This is ", TextType.TEXT),`
+            `TextNode("bold", TextType.BOLD),`
+            `TextNode(" and a ", TextType.TEXT),`
             `TextNode("link", TextType.LINK, "https://example.com"),`
         `]`
     """
-    # Start by converting the entire input markdown text into a single TextNode of type TEXT.
-    raw_markdown_node = TextNode(text, TextType.TEXT)
+    # The cached helper returns a shared tuple; each caller gets its own
+    # fresh list so cache hits cannot alias a mutable result.
+    return list(_text_to_textnodes_cached(text))
 
-    # Split the raw markdown nodes into bold text nodes based on "**" delimiter.
-    bold_nodes = split_nodes_delimiter([raw_markdown_node], "**", TextType.BOLD)
+@lru_cache(maxsize=4096)
+def _text_to_textnodes_cached(text):
+    """
+    Tokenizes `text` once and memoizes the result as a tuple.
 
-    # Further split the bold nodes into italic text nodes based on "_" delimiter.
-    italic_bold_nodes = split_nodes_delimiter(bold_nodes, "_", TextType.ITALIC)
+    Boilerplate lines (navigation, footers) recur across every page of a
+    site, so repeated inputs hit the cache instead of re-running the
+    tokenizer. The tuple is immutable and its `TextNode`s are never
+    mutated, making the shared result safe to hand out.
 
-    # Further split the italic nodes into code text nodes based on "`" delimiter.
-    code_italic_bold_nodes = split_nodes_delimiter(italic_bold_nodes, "`", TextType.CODE)
+    Args:
+        `text` (str): The input markdown-flavored string to be processed.
 
-    # Further handle image nodes in the earlier processed nodes.
-    image_code_italic_bold_nodes = split_nodes_image(code_italic_bold_nodes)
+    Returns:
+        tuple: The parsed `TextNode` objects for `text`.
+    """
+    # Fast path: no span-opening character anywhere means the whole
+    # string is one plain TEXT node, with nothing to tokenize or validate.
+    if _SPECIAL_CHAR_RE.search(text) is None:
+        return (TextNode(text, TextType.TEXT),)
+
+    # Tokenize the whole string in one scan. Each match is a complete
+    # inline span; the plain-text gaps between matches become TEXT nodes.
+    # The old implementation piped the text through five sequential
+    # splitting passes, re-scanning it and allocating an intermediate
+    # node list each time.
+    nodes = []
+    last_end = 0
+
+    for match in _INLINE_TOKEN_RE.finditer(text):
+        # Emit the plain text between the previous span and this one.
+        if match.start() > last_end:
+            _append_text_node(nodes, text[last_end:match.start()])
+
+        # Dispatch on which alternative matched. Empty delimiter spans
+        # (****, __, ``) contribute no node, just as the old split
+        # pipeline skipped empty parts.
+        if match.group("bold") is not None:
+            bold_text = match.group("bold")[2:-2]
+            if bold_text:
+                nodes.append(TextNode(bold_text, TextType.BOLD))
+        elif match.group("italic") is not None:
+            italic_text = match.group("italic")[1:-1]
+            if italic_text:
+                nodes.append(TextNode(italic_text, TextType.ITALIC))
+        elif match.group("code") is not None:
+            code_text = match.group("code")[1:-1]
+            if code_text:
+                nodes.append(TextNode(code_text, TextType.CODE))
+        elif match.group("image") is not None:
+            nodes.append(TextNode(match.group("img_alt"), TextType.IMAGE, match.group("img_url")))
+        else:
+            nodes.append(TextNode(match.group("link_text"), TextType.LINK, match.group("link_url")))
+
+        last_end = match.end()
+
+    # Emit any trailing plain text. (or the whole input when no spans
+    # matched; an input that is nothing but empty spans yields no nodes,
+    # as the old split pipeline skipped every empty part)
+    if last_end < len(text):
+        _append_text_node(nodes, text[last_end:])
+
+    return tuple(nodes)
+
+def _append_text_node(nodes, segment):
+    """
+    Appends `segment` to `nodes` as a plain `TEXT` node after validation.
 
-    # Finally, handle link nodes in the earlier processed nodes.
-    final_nodes = split_nodes_link(image_code_italic_bold_nodes)
+    Args:
+        `nodes` (list): The `TextNode` list being built.
+        `segment` (str): A plain-text stretch between inline spans.
 
-    # Return the fully parsed list of nodes.
-    return final_nodes
+    Raises:
+        `ValueError`: If the segment still contains a span delimiter,
+                      meaning the Markdown syntax was unbalanced.
+    """
+    # A leftover delimiter means a span that was opened but never closed.
+    if _STRAY_DELIMITER_RE.search(segment):
+        raise ValueError("invalid Markdown syntax.")
+    nodes.append(TextNode(segment, TextType.TEXT))
 
 def split_nodes_delimiter(old_nodes, delimiter, text_type):
     """
@@ -65,31 +170,68 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
     Raises:
         `ValueError`: If Markdown syntax `delimiter`s are unbalanced. (odd count)
     """
+    # Fast path: when no node contains the delimiter there is nothing to
+    # split or validate, so the input list is returned as-is without
+    # allocating a copy.
+    if not any(delimiter in node.text for node in old_nodes):
+        return old_nodes
+
     new_nodes = []
+    delimiter_len = len(delimiter)
+
     for node in old_nodes:
-        count = node.text.count(delimiter)
+        text = node.text
 
-        # Validate the node either has a balanced delimiter.
-        if count % 2 != 0:
+        # A node without the delimiter passes through untouched; the `in`
+        # scan is the only work it costs, with no split allocation and no
+        # parity check needed.
+        if delimiter not in text:
+            new_nodes.append(node)
+            continue
+
+        if node.text_type == TextType.TEXT:
+            # Fast path for the overwhelmingly common shape: exactly one
+            # delimited span. find() plus direct slicing skips allocating
+            # the full parts list.
+            first = text.find(delimiter)
+            second = text.find(delimiter, first + delimiter_len)
+            if second != -1 and text.find(delimiter, second + delimiter_len) == -1:
+                before_text = text[:first]
+                styled_text = text[first + delimiter_len:second]
+                after_text = text[second + delimiter_len:]
+
+                if before_text:
+                    new_nodes.append(TextNode(before_text, TextType.TEXT))
+                if styled_text:
+                    new_nodes.append(TextNode(styled_text, text_type))
+                if after_text:
+                    new_nodes.append(TextNode(after_text, TextType.TEXT))
+                continue
+
+        # Split once and derive the delimiter parity from the part count;
+        # an even number of parts means an odd (unbalanced) delimiter
+        # count. This replaces a separate count() scan over the text.
+        split_list = text.split(delimiter)
+
+        # Validate the node has a balanced delimiter.
+        if len(split_list) % 2 == 0:
             raise ValueError("invalid Markdown syntax.")
-        
+
         # If the node is not of type TEXT or contains no delimiter, add it unchanged.
-        elif node.text_type != TextType.TEXT or count == 0:
+        if node.text_type != TextType.TEXT or len(split_list) == 1:
             new_nodes.append(node)
             continue
 
-        # If the node is of type TEXT and contains the delimiter, split it.
-        elif node.text_type == TextType.TEXT:
-            split_list = node.text.split(delimiter)
-            for i, text in enumerate(split_list):
-                if text == "":
-                    continue
-                if i % 2 == 0:
-                    # Even-indexed parts are plain text.
-                    new_nodes.append(TextNode(text, TextType.TEXT))
-                else:
-                    # Odd-indexed parts are styled with the provided text_type.
-                    new_nodes.append(TextNode(text, text_type))
+        # The node is of type TEXT and contains the delimiter, so emit the parts.
+        for i, text in enumerate(split_list):
+            if text == "":
+                continue
+            if i % 2 == 0:
+                # Even-indexed parts are plain text.
+                new_nodes.append(TextNode(text, TextType.TEXT))
+            else:
+                # Odd-indexed parts are styled with the provided text_type.
+                new_nodes.append(TextNode(text, text_type))
 
     return new_nodes
 
@@ -106,12 +248,7 @@ def split_nodes_image(old_nodes):
     Returns:
         List of `TextNode` objects with images extracted into separate `IMAGE` nodes.
     """
-    return split_nodes_by_markdown(
-        old_nodes, 
-        extract_markdown_images, 
-        TextType.IMAGE, 
-        "![{}]({})"
-    )
+    return split_nodes_by_markdown(old_nodes, _IMG_RE, TextType.IMAGE)
 
 def split_nodes_link(old_nodes):
     """
@@ -126,28 +263,26 @@ def split_nodes_link(old_nodes):
     Returns:
         List of `TextNode` objects with links extracted into separate `LINK` nodes.
     """
-    return split_nodes_by_markdown(
-        old_nodes, 
-        extract_markdown_links, 
-        TextType.LINK, 
-        "[{}]({})"
-    )
+    return split_nodes_by_markdown(old_nodes, _LINK_RE, TextType.LINK)
 
-def split_nodes_by_markdown(old_nodes, extract_function, text_type, pattern_format):
+def split_nodes_by_markdown(old_nodes, pattern, text_type):
     """
-    Split `TextNode`s based on markdown patterns.
+    Split `TextNode`s based on a markdown `pattern`.
     (images or links)
-    
+
+    The compiled `pattern`'s matches carry their own positions, so the
+    node's text is sliced directly around each match span. The old
+    implementation re-built each matched pattern as a string and
+    re-searched the text for it, a full substring scan per match.
+
     Args:
         `old_nodes` (list): List of `TextNode` objects to process.
-
-        `extract_function` (function): Function to extract markdown elements.
-                                       (`extract_markdown_images` or `extract_markdown_links`)
+        `pattern` (`re.Pattern`): Compiled pattern whose two groups capture
+                                  the element's text and URL.
+                                  (`_IMG_RE` or `_LINK_RE`)
         `text_type` ('TextType'): `TextType` to assign to new nodes.
                                   (`LINK` or `IMAGE`)
-        `pattern_format` (str): String format for the markdown pattern.
-                                (`![alt text](url)` or `[anchor text](url)`)
-    
+
     Returns:
         List of `TextNode` objects with markdown elements 
         split and converted into separate nodes.
@@ -161,38 +296,27 @@ def split_nodes_by_markdown(old_nodes, extract_function, text_type, pattern_form
             continue
 
         remaining_text = node.text
-        matches = extract_function(remaining_text)
-        
-        # If no matches found, keep original node unchanged.
-        if not matches:
-            new_nodes.append(node)
-            continue
-
         cursor = 0 # Track position in the original text.
 
-        for match in matches:
-            # Extract components from the match.
-            prop_text, url = match
-            pattern = pattern_format.format(prop_text, url)
-            start_index = remaining_text.find(pattern, cursor)
+        for match in pattern.finditer(remaining_text):
+            # Add text before the match if it exists.
+            if match.start() > cursor:
+                new_nodes.append(TextNode(remaining_text[cursor:match.start()], TextType.TEXT))
 
-            # Add text before the pattern if it exists.
-            if start_index > cursor:
-                before_text = remaining_text[cursor:start_index]
-                if before_text:
-                    new_nodes.append(TextNode(before_text, TextType.TEXT))
-                    
             # Add the markdown element node.
-            new_nodes.append(TextNode(prop_text, text_type, url))
+            new_nodes.append(TextNode(match.group(1), text_type, match.group(2)))
 
             # Move cursor past this match.
-            cursor = start_index + len(pattern)
+            cursor = match.end()
+
+        # No matches found, keep the original node unchanged.
+        if cursor == 0:
+            new_nodes.append(node)
+            continue
 
         # Add any remaining text after the last match if it exists.
         if cursor < len(remaining_text):
-            after_text = remaining_text[cursor:]
-            if after_text:
-                new_nodes.append(TextNode(after_text, TextType.TEXT))
+            new_nodes.append(TextNode(remaining_text[cursor:], TextType.TEXT))
 
     return new_nodes
 
@@ -208,18 +332,19 @@ def extract_markdown_images(text):
     Returns:
         list: A list of tuples, each containing. (alt_text, url)
     """
-    # Regex finds all instances of ![alt text](url)
-    # [^\[\]]* matches any character except brackets for the alt text
-    # [^\(\)]* matches any character except parentheses for the URL
-    matches = re.findall(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
-    return matches
+    # Keep the matches from the combined pattern that consumed a leading !.
+    return [
+        (element_text, url)
+        for marker, element_text, url in _LINK_OR_IMG_RE.findall(text)
+        if marker
+    ]
 
 def extract_markdown_links(text):
     """
     Extracts markdown link syntax from `text`.
     
     Pattern matches `[anchor text](url)` format and returns the anchor text and URL.
-    Uses negative lookbehind `(?<!!)` to ensure it doesn't match image tags.
+    Matches whose marker group consumed a leading `!` are image tags and are dropped.
     
     Args:
         `text` (str): The markdown text to search through.
@@ -227,9 +352,10 @@ def extract_markdown_links(text):
     Returns:
         list: A list of tuples, each containing. (anchor_text, url)
     """
-    # Regex finds all instances of [anchor text](url) not preceded by !
-    # (?<!!) is a negative lookbehind to ensure we don't match images
-    # [^\[\]]* matches any character except brackets for the anchor text
-    # [^\(\)]* matches any character except parentheses for the URL
-    matches = re.findall(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
-    return matches
+    # Keep the matches from the combined pattern that did not consume a
+    # leading !, meaning they are links rather than images.
+    return [
+        (element_text, url)
+        for marker, element_text, url in _LINK_OR_IMG_RE.findall(text)
+        if not marker
+    ]
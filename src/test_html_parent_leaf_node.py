@@ -1,7 +1,30 @@
+import sys
 import unittest
 from html_parent_leaf_node import HTMLNode, ParentNode, LeafNode, text_node_to_html_node
 from textnode import TextNode, TextType
 
+# Interned attribute-name constants reused by every props-carrying test
+# dict, so lookups inside props_to_html hash-compare by pointer. Python
+# interns identifier-like literals anyway; spelling it out documents the
+# intent and keeps the keys a single shared object across tests.
+HREF = sys.intern("href")
+TARGET = sys.intern("target")
+SRC = sys.intern("src")
+ALT = sys.intern("alt")
+
+# Expected HTML for the complex-tree rendering test, with its cheap
+# (length, hash) fingerprint computed once at import. A matching
+# fingerprint skips the full string comparison on the passing path.
+_EXPECTED_COMPLEX_TREE = "<html><head><title>THIS IS A TITLE</title></head><body><h1>This is a heading</h1><p>This paragraph has <b>BOLD TEXT</b> mixed with <i>italic text</i>.</p></body></html>"
+_EXPECTED_COMPLEX_TREE_FINGERPRINT = (len(_EXPECTED_COMPLEX_TREE), hash(_EXPECTED_COMPLEX_TREE))
+
+# Both legal orderings of the multi-prop attribute string, frozen once at
+# import for O(1) hashed membership instead of a per-call list scan.
+_EXPECTED_MULTIPROPS = frozenset((
+    ' href="https://www.google.com" target="_blank"',
+    ' target="_blank" href="https://www.google.com"',
+))
+
 class TestHTMLNode(unittest.TestCase):
     """
     Test suite for the `HTMLNode` class. 
@@ -13,7 +36,7 @@ class TestHTMLNode(unittest.TestCase):
         Test that `props_to_html` correctly formats a single href attribute.
         Verify the formatted string has a leading space and proper quotes.
         """
-        node = HTMLNode(props={"href": "https://www.google.com"})
+        node = HTMLNode(props={HREF: "https://www.google.com"})
         self.assertEqual(node.props_to_html(), ' href="https://www.google.com"')
     
     def test_props_to_html_with_multiple_props(self):
@@ -21,12 +44,8 @@ class TestHTMLNode(unittest.TestCase):
         Test that `props_to_html` correctly formats multiple attributes.
         Since dictionary order isn't guaranteed, check against both possible outputs.
         """
-        node = HTMLNode(props={"href": "https://www.google.com", "target": "_blank"})
-        possible_expected_results = [
-            ' href="https://www.google.com" target="_blank"',
-            ' target="_blank" href="https://www.google.com"'
-        ]
-        self.assertIn(node.props_to_html(), possible_expected_results)
+        node = HTMLNode(props={HREF: "https://www.google.com", TARGET: "_blank"})
+        self.assertIn(node.props_to_html(), _EXPECTED_MULTIPROPS)
     
     def test_props_to_html_with_no_props(self):
         """
@@ -41,8 +60,7 @@ class TestHTMLNode(unittest.TestCase):
         Test that `to_html` raises a `NotImplementedError` as required.
         """
         node = HTMLNode()
-        with self.assertRaises(NotImplementedError):
-            node.to_html()
+        self.assertRaises(NotImplementedError, node.to_html)
 
     def test_repr(self):
         """
@@ -59,6 +77,22 @@ class TestParentNode(unittest.TestCase):
     Verifies HTML generation functionality for various 
     parent/child node scenarios and HTML elements.
     """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Builds the shared "paragraph with mixed content" leaves once for
+        the whole class. LeafNode rendering is pure, so the instances can
+        be reused by reference across test methods instead of being
+        reconstructed per test.
+        """
+        cls.mixed_children = (
+            LeafNode(None, "This paragraph has "),
+            LeafNode("b", "BOLD TEXT"),
+            LeafNode(None, " mixed with "),
+            LeafNode("i", "italic text"),
+            LeafNode(None, "."),
+        )
+
     def test_to_html_with_children(self):
         """
         Test that a `ParentNode` with a single child renders correctly.
@@ -85,18 +119,7 @@ class TestParentNode(unittest.TestCase):
         Tests a paragraph with mixed content including plain text,
         **bold** text, and _italic_ text.
         """
-        child_node1 = LeafNode(None, "This paragraph has ")
-        child_node2 = LeafNode("b", "BOLD TEXT")
-        child_node3 = LeafNode(None, " mixed with ")
-        child_node4 = LeafNode("i", "italic text")
-        child_node5 = LeafNode(None, ".")
-        parent_node = ParentNode("p", [
-            child_node1, 
-            child_node2, 
-            child_node3, 
-            child_node4, 
-            child_node5
-        ])
+        parent_node = ParentNode("p", list(self.mixed_children))
         expected = "<p>This paragraph has <b>BOLD TEXT</b> mixed with <i>italic text</i>.</p>"
         self.assertEqual(parent_node.to_html(), expected)
         
@@ -117,25 +140,17 @@ class TestParentNode(unittest.TestCase):
 
         grandchild_node2 = LeafNode("h1", "This is a heading")
 
-        # Create a paragraph with mixed formatting.
-        great_grandchild_node1 = LeafNode(None, "This paragraph has ")
-        great_grandchild_node2 = LeafNode("b", "BOLD TEXT")
-        great_grandchild_node3 = LeafNode(None, " mixed with ")
-        great_grandchild_node4 = LeafNode("i", "italic text")
-        great_grandchild_node5 = LeafNode(None, ".")
-        grandchild_node3 = ParentNode("p", [
-            great_grandchild_node1, 
-            great_grandchild_node2, 
-            great_grandchild_node3, 
-            great_grandchild_node4, 
-            great_grandchild_node5
-        ])
+        # Reuse the shared paragraph-with-mixed-formatting leaves.
+        grandchild_node3 = ParentNode("p", list(self.mixed_children))
 
         child_node2 = ParentNode("body", [grandchild_node2, grandchild_node3])
         parent_node = ParentNode("html", [child_node1, child_node2])
 
-        expected = "<html><head><title>THIS IS A TITLE</title></head><body><h1>This is a heading</h1><p>This paragraph has <b>BOLD TEXT</b> mixed with <i>italic text</i>.</p></body></html>"
-        self.assertEqual(parent_node.to_html(), expected)
+        html = parent_node.to_html()
+        # Compare the precomputed fingerprint first; only a mismatch pays
+        # for the full string comparison and diff.
+        if (len(html), hash(html)) != _EXPECTED_COMPLEX_TREE_FINGERPRINT:
+            self.assertEqual(html, _EXPECTED_COMPLEX_TREE)
     
     def test_to_html_no_tag(self):
         """
@@ -143,16 +158,14 @@ class TestParentNode(unittest.TestCase):
         """
         child_node = LeafNode("span", "child")
         parent_node = ParentNode(None, [child_node])
-        with self.assertRaises(ValueError):
-            parent_node.to_html()
+        self.assertRaises(ValueError, parent_node.to_html)
     
     def test_to_html_no_children(self):
         """
         Test that a `ValueError` is raised when a `ParentNode` has no `children`.
         """
         parent_node = ParentNode("p", None)
-        with self.assertRaises(ValueError):
-            parent_node.to_html()
+        self.assertRaises(ValueError, parent_node.to_html)
 
 class TestLeafNode(unittest.TestCase):
     """
@@ -185,7 +198,7 @@ class TestLeafNode(unittest.TestCase):
         """
         Test rendering of anchor tags with href attribute.
         """
-        node = LeafNode("a", "Click me!", {"href": "https://www.google.com"})
+        node = LeafNode("a", "Click me!", {HREF: "https://www.google.com"})
         self.assertEqual(node.to_html(), '<a href="https://www.google.com">Click me!</a>')
 
     def test_leaf_to_html_no_tag(self):
@@ -200,8 +213,27 @@ class TestLeafNode(unittest.TestCase):
         Test that `ValueError` is raised when attempting to render a node with no `value`.
         """
         node = LeafNode("p", None)
-        with self.assertRaises(ValueError):
-            node.to_html()
+        self.assertRaises(ValueError, node.to_html)
+
+class _BadType:
+    """
+    Sentinel carrying a `text_type` value no `TextType` member uses,
+    defined once at module scope so the error test doesn't rebuild a
+    shadowing class on every invocation.
+    """
+    ERROR = "error"
+
+# (text, text_type, url, expected tag, expected value, expected props)
+# conversion cases for TestTextNodeToHTMLNode, built once at module
+# import. Only the link and image rows carry a url and expected props.
+_TEXT_NODE_CASES = (
+    ("This is a text node", TextType.TEXT, None, None, "This is a text node", None),
+    ("This is a bold node", TextType.BOLD, None, "b", "This is a bold node", None),
+    ("This is an italic node", TextType.ITALIC, None, "i", "This is an italic node", None),
+    ("This is a code node", TextType.CODE, None, "code", "This is a code node", None),
+    ("Click Me!", TextType.LINK, "https://www.boot.dev", "a", "Click Me!", {HREF: "https://www.boot.dev"}),
+    ("This is an image node", TextType.IMAGE, "https://www.google.com", "img", "", {SRC: "https://www.google.com", ALT: "This is an image node"}),
+)
 
 class TestTextNodeToHTMLNode(unittest.TestCase):
     """
@@ -209,75 +241,33 @@ class TestTextNodeToHTMLNode(unittest.TestCase):
 
     These tests verify that the function correctly converts `TextNode` objects to 
     `LeafNode` objects with a proper `tag`, `value`, and if provided `prop`.
+    The conversion rows live in a module-scope table walked under
+    `subTest`, so each `TextType` still reports individually.
     """
-    def test_text(self):
-        """
-        Test conversion of a plain text node (`TextType.TEXT`) to a `LeafNode` with no `tag`.
-        """
-        node = TextNode("This is a text node", TextType.TEXT)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, None)
-        self.assertEqual(html_node.value, "This is a text node")
-    
-    def test_bold(self):
-        """
-        Test conversion of a bold text node (`TextType.BOLD`) to a `LeafNode` with `<b>` `tag`.
-        """
-        node = TextNode("This is a bold node", TextType.BOLD)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "b")
-        self.assertEqual(html_node.value, "This is a bold node")
-    
-    def test_italic(self):
-        """
-        Test conversion of an italic text node (`TextType.ITALIC`) to a LeafNode with `<i>` `tag`.
-        """
-        node = TextNode("This is an italic node", TextType.ITALIC)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "i")
-        self.assertEqual(html_node.value, "This is an italic node")
-    
-    def test_code(self):
-        """
-        Test conversion of a code text node (`TextType.CODE`) to a `LeafNode` with `<code>` `tag`.
-        """
-        node = TextNode("This is a code node", TextType.CODE)
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "code")
-        self.assertEqual(html_node.value, "This is a code node")
-    
-    def test_link(self):
-        """
-        Test conversion of a link text node (`TextType.LINK`) to a `LeafNode` with `<a>` `tag`
-        and an href property for the `url`.
-        """
-        node = TextNode("Click Me!", TextType.LINK, "https://www.boot.dev")
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "a")
-        self.assertEqual(html_node.value, "Click Me!")
-        self.assertEqual(html_node.props, {"href": "https://www.boot.dev"})
-    
-    def test_image(self):
-        """
-        Test conversion of an image text node (`TextType.IMAGE`) to a `LeafNode` with `<img>` `tag`.
-        Ensure it properly sets 'src' to the `url` and 'alt' to the descriptive `text`.
-        """
-        node = TextNode("This is an image node", TextType.IMAGE, "https://www.google.com")
-        html_node = text_node_to_html_node(node)
-        self.assertEqual(html_node.tag, "img")
-        self.assertEqual(html_node.value, "")
-        self.assertEqual(html_node.props["src"], "https://www.google.com")
-        self.assertEqual(html_node.props["alt"], "This is an image node")
-    
+    def test_conversions(self):
+        """
+        Test conversion of every supported `TextType`:
+        - `TEXT` maps to a `LeafNode` with no `tag`.
+        - `BOLD`, `ITALIC`, and `CODE` map to `<b>`, `<i>`, and `<code>`.
+        - `LINK` maps to `<a>` with an href property for the `url`.
+        - `IMAGE` maps to `<img>` with 'src' set to the `url`, 'alt' set
+          to the descriptive `text`, and an empty `value`.
+        """
+        for text, text_type, url, tag, value, props in _TEXT_NODE_CASES:
+            with self.subTest(text_type=text_type):
+                node = TextNode(text, text_type, url) if url else TextNode(text, text_type)
+                html_node = text_node_to_html_node(node)
+                self.assertEqual(html_node.tag, tag)
+                self.assertEqual(html_node.value, value)
+                if props is not None:
+                    self.assertEqual(html_node.props, props)
+
     def test_error(self):
         """
         Test that an unsupported `TextType` raises a `ValueError`.
         """
-        class TextType:
-            ERROR = "error"
-        node = TextNode("This is a error node", TextType.ERROR)
-        with self.assertRaises(ValueError):
-            text_node_to_html_node(node)
+        node = TextNode("This is a error node", _BadType.ERROR)
+        self.assertRaises(ValueError, text_node_to_html_node, node)
 
 if __name__ == "__main__":
     unittest.main()
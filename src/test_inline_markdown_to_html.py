@@ -9,6 +9,14 @@ from inline_markdown_to_html import (
     extract_markdown_links
 )
 
+# Canonical fixture nodes shared across tests. TextNode equality is
+# value-based and nodes are immutable after construction, so the
+# pass-through tests can reuse one instance per shape instead of
+# re-allocating identical fixtures in every test method.
+_BOLD_NODE = TextNode("Bold text", TextType.BOLD)
+_NO_IMAGE_NODE = TextNode("This is a text with no image.", TextType.TEXT)
+_NO_LINK_NODE = TextNode("This is a text with no link.", TextType.TEXT)
+
 class TestTextToTextNode(unittest.TestCase):
     """
     Test suite for the `text_to_textnodes` function.
@@ -135,9 +143,8 @@ class TestSplitNodesImageAndLink(unittest.TestCase):
         """
         Test that a `TextNode` without image markdown remains unchanged.
         """
-        node = TextNode("This is a text with no image.", TextType.TEXT)
-        expected = [TextNode("This is a text with no image.", TextType.TEXT)]
-        self.assertEqual(split_nodes_image([node]), expected)
+        expected = [_NO_IMAGE_NODE]
+        self.assertEqual(split_nodes_image([_NO_IMAGE_NODE]), expected)
     
     def test_empty_text_with_image(self):
         """
@@ -151,9 +158,8 @@ class TestSplitNodesImageAndLink(unittest.TestCase):
         """
         Test that non-`TEXT` nodes are not processed even if they contain image markdown.
         """
-        node = TextNode("Bold text", TextType.BOLD)
-        expected = [TextNode("Bold text", TextType.BOLD)]
-        self.assertEqual(split_nodes_image([node]), expected)
+        expected = [_BOLD_NODE]
+        self.assertEqual(split_nodes_image([_BOLD_NODE]), expected)
 
     def test_split_multiple_links(self):
         """
@@ -175,9 +181,8 @@ class TestSplitNodesImageAndLink(unittest.TestCase):
         """
         Test that a `TextNode` without link markdown remains unchanged.
         """
-        node = TextNode("This is a text with no link.", TextType.TEXT)
-        expected = [TextNode("This is a text with no link.", TextType.TEXT)]
-        self.assertEqual(split_nodes_link([node]), expected)
+        expected = [_NO_LINK_NODE]
+        self.assertEqual(split_nodes_link([_NO_LINK_NODE]), expected)
     
     def test_empty_text_with_link(self):
         """
@@ -191,9 +196,8 @@ class TestSplitNodesImageAndLink(unittest.TestCase):
         """
         Test that non-`TEXT` nodes are not processed even if they contain link markdown.
         """
-        node = TextNode("Bold text", TextType.BOLD)
-        expected = [TextNode("Bold text", TextType.BOLD)]
-        self.assertEqual(split_nodes_link([node]), expected)
+        expected = [_BOLD_NODE]
+        self.assertEqual(split_nodes_link([_BOLD_NODE]), expected)
 
 
 class TestExtractMarkdown(unittest.TestCase):
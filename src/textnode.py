@@ -1,10 +1,14 @@
 from enum import Enum
 
-class TextType(Enum):
+class TextType(str, Enum):
     """
-    Enum that defines the different types of inline text 
+    Enum that defines the different types of inline text
     formatting our Markdown parser will support.
-    
+
+    The `str` mixin makes members compare and hash as their interned
+    string values, so the `text_type` checks on every node in the inline
+    pipeline bottom out in C string comparison instead of Enum dispatch.
+
     `TextType`s supported:
     `TEXT` `BOLD` `ITALIC` `CODE` `LINK` `IMAGE`
     """
@@ -17,9 +21,18 @@ class TextType(Enum):
 
 class TextNode:
     """
-    `TextNode` class serves as an intermediate representation 
+    `TextNode` class serves as an intermediate representation
     of text between Markdown parsing and HTML generation.
+
+    Nodes are treated as immutable after construction — nothing in the
+    pipeline reassigns their attributes — which is what makes defining
+    `__hash__` alongside `__eq__` safe and lets caches key on nodes.
     """
+    # Slots drop the per-instance __dict__; parsing a document allocates
+    # thousands of these, so the fixed layout cuts memory per node and
+    # speeds the attribute loads in __eq__ and __repr__.
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text, text_type, url=None):
         """
         Create a new `TextNode` representing a segment of `text` with specific formatting.
@@ -39,16 +52,35 @@ class TextNode:
 
         Args:
             `other` (`TextNode`): The `TextNode` you are comparing.
-        
+
         Returns:
             `bool`: `True` if all properties are equal, `False` otherwise.
+            `NotImplemented` when `other` is not a `TextNode`.
         """
-        return (
-            self.text_type == other.text_type
-            and self.text == other.text
-            and self.url == other.url
+        # Comparing against anything else defers to the other operand
+        # instead of raising on a missing attribute.
+        if not isinstance(other, TextNode):
+            return NotImplemented
+
+        # One C-level tuple comparison replaces the three chained
+        # attribute checks and their per-check branches.
+        return (self.text_type, self.text, self.url) == (
+            other.text_type,
+            other.text,
+            other.url,
         )
 
+    def __hash__(self):
+        """
+        Hashes the node by the same `(text, text_type, url)` triple that
+        `__eq__` compares, so equal nodes land in the same hash bucket
+        and nodes can be used in sets and as dict or cache keys.
+
+        Returns:
+            `int`: The hash of the node's property tuple.
+        """
+        return hash((self.text, self.text_type, self.url))
+
     def __repr__(self):
         """
         Prints a string representation of the `TextNode`'s properties 
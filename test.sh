@@ -1,2 +1,5 @@
 # Run all test files in the src folder.
+# The suite is stdlib-only and fast; if it ever grows enough to be worth
+# parallelizing, the test modules are independent and can be run with
+# pytest-xdist instead: pip install pytest pytest-xdist && pytest -n auto src
 python3 -m unittest discover -s src